@@ -264,6 +264,15 @@ class Backplane(object):
 
         return self._dlos_duv1
 
+    @property
+    def dlos_norms(self):
+        """Tuple of Scalars containing the norms of dlos/du and dlos/dv."""
+
+        if not hasattr(self, '_dlos_norms'):
+            self._dlos_norms = Backplane._denom_norms(self.dlos_duv)
+
+        return self._dlos_norms
+
     @property
     def duv_dlos(self):
         if not hasattr(self, '_duv_dlos'):
@@ -278,6 +287,18 @@ class Backplane(object):
 
         return self._center_dlos_duv
 
+    @property
+    def center_dlos_norms(self):
+        """Tuple of Scalars containing the norms of the center dlos/du and
+        dlos/dv.
+        """
+
+        if not hasattr(self, '_center_dlos_norms'):
+            self._center_dlos_norms = Backplane._denom_norms(
+                                                        self.center_dlos_duv)
+
+        return self._center_dlos_norms
+
     @property
     def center_duv_dlos(self):
         if not hasattr(self, '_center_duv_dlos'):
@@ -285,12 +306,23 @@ class Backplane(object):
 
         return self._center_duv_dlos
 
+    @staticmethod
+    def _denom_norms(dlos_duv):
+        """The u and v norms of a dlos_duv Vector3, from a single pass over
+        its values.
+        """
+
+        vals = dlos_duv.vals
+        norms = np.sqrt(np.einsum('...ij,...ij->...j', vals, vals))
+        return (Scalar(norms[..., 0], dlos_duv.mask),
+                Scalar(norms[..., 1], dlos_duv.mask))
+
     ############################################################################
     # Dictionary keys
     ############################################################################
 
     @staticmethod
-    @functools.lru_cache(maxsize=100)
+    @functools.lru_cache(maxsize=1024)
     def standardize_event_key(event_key, default=''):
         """Repair an event key to make it suitable for indexing a dictionary.
 
@@ -369,7 +401,7 @@ class Backplane(object):
         return Backplane._is_dispersed(event_key) and len(event_key) == 3
 
     @staticmethod
-    @functools.lru_cache(maxsize=100)
+    @functools.lru_cache(maxsize=1024)
     def gridless_event_key(event_key, default=''):
         """Convert event key to gridless."""
 
@@ -401,7 +433,7 @@ class Backplane(object):
         return Backplane._standardize_backplane_key_if_not_qube(backplane_key)
 
     @staticmethod
-    @functools.lru_cache(maxsize=100)
+    @functools.lru_cache(maxsize=1024)
     def _standardize_backplane_key_if_not_qube(backplane_key):
 
         if isinstance(backplane_key, str):
@@ -445,7 +477,7 @@ class Backplane(object):
 
     #===========================================================================
     @staticmethod
-    @functools.lru_cache(maxsize=100)
+    @functools.lru_cache(maxsize=1024)
     def get_body_and_modifier(surface_key):
         """A body object and modifier based on the given surface key.
 
@@ -456,20 +488,8 @@ class Backplane(object):
 
         surface_id = surface_key.upper()
 
-        modifier = None
-        if surface_id.endswith(':ANSA'):
-            modifier = 'ANSA'
-            body_id = surface_id[:-5]
-
-        elif surface_id.endswith(':RING'):
-            modifier = 'RING'
-            body_id = surface_id[:-5]
-
-        elif surface_id.endswith(':LIMB'):
-            modifier = 'LIMB'
-            body_id = surface_id[:-5]
-
-        else:
+        (body_id, sep, modifier) = surface_id.rpartition(':')
+        if not sep or modifier not in ('ANSA', 'RING', 'LIMB'):
             modifier = None
             body_id = surface_id
 
@@ -477,7 +497,7 @@ class Backplane(object):
 
     #===========================================================================
     @staticmethod
-    @functools.lru_cache(maxsize=100)
+    @functools.lru_cache(maxsize=1024)
     def unmasked_surface_key(surface_key):
         """The unmasked surface key associated with a given surface key.
         Example: SATURN_MAIN_RINGS -> SATURN:RING.
@@ -530,7 +550,7 @@ class Backplane(object):
 
     #===========================================================================
     @staticmethod
-    @functools.lru_cache(maxsize=100)
+    @functools.lru_cache(maxsize=1024)
     def unmasked_event_key(event_key):
         """Return the unmasked event key based on an event key.
         """
@@ -545,7 +565,7 @@ class Backplane(object):
 
     #===========================================================================
     @staticmethod
-    @functools.lru_cache(maxsize=100)
+    @functools.lru_cache(maxsize=1024)
     def intercept_dict_key(event_key):
         """Return the key for the intercepts dictionary based on an event key.
         """
@@ -611,7 +631,7 @@ class Backplane(object):
 
     #===========================================================================
     @staticmethod
-    @functools.lru_cache(maxsize=100)
+    @functools.lru_cache(maxsize=1024)
     def get_surface(surface_key):
         """A surface based on its surface key."""
 
@@ -676,11 +696,13 @@ class Backplane(object):
         v_min = body_dict['v_min'] - self.inventory_border
         v_max = body_dict['v_max'] + self.inventory_border
 
-        antimask = np.ones(self.meshgrid.shape, dtype='bool')
-        antimask[self.meshgrid.uv.values[...,0] <  u_min] = False
-        antimask[self.meshgrid.uv.values[...,0] >= u_max] = False
-        antimask[self.meshgrid.uv.values[...,1] <  v_min] = False
-        antimask[self.meshgrid.uv.values[...,1] >= v_max] = False
+        u = self.meshgrid.uv.values[...,0]
+        v = self.meshgrid.uv.values[...,1]
+        antimask = (u >= u_min) & (u < u_max) & (v >= v_min) & (v < v_max)
+
+        # A bounding box that covers the whole meshgrid needs no array
+        if np.all(antimask):
+            antimask = True
 
         self.antimasks[body_name] = antimask
         return antimask
@@ -881,7 +903,7 @@ class Backplane(object):
             backplane = Boolean(bool(backplane))
 
         elif isinstance(backplane, np.ndarray):
-            backplane = Scalar(backplane)
+            backplane = Scalar(np.asarray(backplane, order='C'))
 
         # Collapse mask if possible
         backplane = backplane.collapse_mask()
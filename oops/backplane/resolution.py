@@ -23,13 +23,14 @@ def resolution(self, event_key, axis='u'):
 
     event_key = Backplane.standardize_event_key(event_key)
     key = ('resolution', event_key, axis)
-    if key not in self.backplanes:
-        distance = self.distance(event_key)
-        (dlos_du, dlos_dv) = self.dlos_duv.extract_denoms()
-        self.register_backplane(key[:-1] + ('u',), distance * dlos_du.norm())
-        self.register_backplane(key[:-1] + ('v',), distance * dlos_dv.norm())
+    if key in self.backplanes:
+        return self.get_backplane(key)
 
-    return self.get_backplane(key)
+    distance = self.distance(event_key)
+    (norm_u, norm_v) = self.dlos_norms
+    res_u = self.register_backplane(key[:-1] + ('u',), distance * norm_u)
+    res_v = self.register_backplane(key[:-1] + ('v',), distance * norm_v)
+    return res_u if axis == 'u' else res_v
 
 #===============================================================================
 def center_resolution(self, event_key, axis='u'):
@@ -50,13 +51,14 @@ def center_resolution(self, event_key, axis='u'):
 
     gridless_key = Backplane.gridless_event_key(event_key)
     key = ('center_resolution', gridless_key, axis)
-    if key not in self.backplanes:
-        distance = self.center_distance(gridless_key)
-        (dlos_du, dlos_dv) = self.center_dlos_duv.extract_denoms()
-        self.register_backplane(key[:-1] + ('u',), distance * dlos_du.norm())
-        self.register_backplane(key[:-1] + ('v',), distance * dlos_dv.norm())
+    if key in self.backplanes:
+        return self.get_backplane(key)
 
-    return self.get_backplane(key)
+    distance = self.center_distance(gridless_key)
+    (norm_u, norm_v) = self.center_dlos_norms
+    res_u = self.register_backplane(key[:-1] + ('u',), distance * norm_u)
+    res_v = self.register_backplane(key[:-1] + ('v',), distance * norm_v)
+    return res_u if axis == 'u' else res_v
 
 #===============================================================================
 def finest_resolution(self, event_key):
@@ -70,10 +72,10 @@ def finest_resolution(self, event_key):
 
     event_key = Backplane.standardize_event_key(event_key)
     key = ('finest_resolution', event_key)
-    if key not in self.backplanes:
-        self._fill_surface_resolution(event_key)
+    if key in self.backplanes:
+        return self.get_backplane(key)
 
-    return self.get_backplane(key)
+    return self._fill_surface_resolution(event_key)[0]
 
 #===============================================================================
 def coarsest_resolution(self, event_key):
@@ -86,22 +88,25 @@ def coarsest_resolution(self, event_key):
 
     event_key = Backplane.standardize_event_key(event_key)
     key = ('coarsest_resolution', event_key)
-    if key not in self.backplanes:
-        self._fill_surface_resolution(event_key)
+    if key in self.backplanes:
+        return self.get_backplane(key)
 
-    return self.get_backplane(key)
+    return self._fill_surface_resolution(event_key)[1]
 
 #===============================================================================
 def _fill_surface_resolution(self, event_key):
-    """Internal method to fill in the surface resolution backplanes."""
+    """Internal method to fill in the surface resolution backplanes; return
+    (finest, coarsest).
+    """
 
     event_key = Backplane.standardize_event_key(event_key)
     event = self.get_surface_event(event_key, derivs=True)
 
     dpos_duv1 = event.pos.d_dlos.chain(self.dlos_duv1)
     (minres, maxres) = Surface.resolution(dpos_duv1)
-    self.register_backplane(('finest_resolution',   event_key), minres)
-    self.register_backplane(('coarsest_resolution', event_key), maxres)
+    minres = self.register_backplane(('finest_resolution',   event_key), minres)
+    maxres = self.register_backplane(('coarsest_resolution', event_key), maxres)
+    return (minres, maxres)
 
 ################################################################################
 
@@ -25,10 +25,10 @@ def right_ascension(self, event_key=(), apparent=True, direction='arr'):
 
     event_key = Backplane.standardize_event_key(event_key)
     key = ('right_ascension', event_key, apparent, direction)
-    if key not in self.backplanes:
-        self._fill_ra_dec(event_key, apparent, direction)
+    if key in self.backplanes:
+        return self.get_backplane(key)
 
-    return self.get_backplane(key)
+    return self._fill_ra_dec(event_key, apparent, direction)[0]
 
 #===============================================================================
 def declination(self, event_key=(), apparent=True, direction='arr'):
@@ -48,14 +48,14 @@ def declination(self, event_key=(), apparent=True, direction='arr'):
 
     event_key = Backplane.standardize_event_key(event_key)
     key = ('declination', event_key, apparent, direction)
-    if key not in self.backplanes:
-        self._fill_ra_dec(event_key, apparent, direction)
+    if key in self.backplanes:
+        return self.get_backplane(key)
 
-    return self.get_backplane(key)
+    return self._fill_ra_dec(event_key, apparent, direction)[1]
 
 #===============================================================================
 def _fill_ra_dec(self, event_key, apparent, direction):
-    """Fill internal backplanes of RA and dec."""
+    """Fill internal backplanes of RA and dec; return them as a tuple."""
 
     if direction not in ('arr', 'dep'):
         raise ValueError('invalid photon direction: ' + direction)
@@ -68,8 +68,9 @@ def _fill_ra_dec(self, event_key, apparent, direction):
     (ra, dec) = event.ra_and_dec(apparent=apparent, subfield=direction,
                                  derivs=self.ALL_DERIVS)
     etc = (event_key, apparent, direction)
-    self.register_backplane(('right_ascension',) + etc, ra)
-    self.register_backplane(('declination',)     + etc, dec)
+    ra  = self.register_backplane(('right_ascension',) + etc, ra)
+    dec = self.register_backplane(('declination',)     + etc, dec)
+    return (ra, dec)
 
 #===============================================================================
 def celestial_north_angle(self, event_key=()):
@@ -178,10 +179,10 @@ def center_right_ascension(self, event_key, apparent=True, direction='arr'):
 
     gridless_key = Backplane.gridless_event_key(event_key)
     key = ('center_right_ascension', gridless_key, apparent, direction)
-    if key not in self.backplanes:
-        self._fill_center_ra_dec(gridless_key, apparent, direction)
+    if key in self.backplanes:
+        return self.get_backplane(key)
 
-    return self.get_backplane(key)
+    return self._fill_center_ra_dec(gridless_key, apparent, direction)[0]
 
 #===============================================================================
 def center_declination(self, event_key, apparent=True, direction='arr'):
@@ -198,25 +199,40 @@ def center_declination(self, event_key, apparent=True, direction='arr'):
 
     gridless_key = Backplane.gridless_event_key(event_key)
     key = ('center_declination', gridless_key, apparent, direction)
-    if key not in self.backplanes:
-        self._fill_center_ra_dec(gridless_key, apparent, direction)
+    if key in self.backplanes:
+        return self.get_backplane(key)
 
-    return self.get_backplane(key)
+    return self._fill_center_ra_dec(gridless_key, apparent, direction)[1]
 
 #===============================================================================
 def _fill_center_ra_dec(self, event_key, apparent, direction):
-    """Internal method to fill in RA and dec for the center of a body."""
+    """Internal method to fill in RA and dec for the center of a body; return
+    them as a tuple.
+    """
 
     if direction not in ('arr', 'dep'):
         raise ValueError('invalid photon direction: ' + direction)
 
     gridless_key = Backplane.gridless_event_key(event_key)
-    event = self.get_obs_event(gridless_key)
-    (ra, dec) = event.ra_and_dec(apparent=apparent, subfield=direction,
-                                 derivs=self.ALL_DERIVS)
     etc = (gridless_key, apparent, direction)
-    self.register_backplane(('center_right_ascension',) + etc, ra)
-    self.register_backplane(('center_declination',)     + etc, dec)
+
+    # With an empty key, this is the observation event also used by the pixel
+    # RA and dec, so re-use those backplanes
+    if not gridless_key:
+        if ('right_ascension',) + etc not in self.backplanes:
+            self._fill_ra_dec(gridless_key, apparent, direction)
+
+        ra  = self.get_backplane(('right_ascension',) + etc, derivs=True)
+        dec = self.get_backplane(('declination',)     + etc, derivs=True)
+        (ra, dec) = (ra.clone(), dec.clone())
+    else:
+        event = self.get_obs_event(gridless_key)
+        (ra, dec) = event.ra_and_dec(apparent=apparent, subfield=direction,
+                                     derivs=self.ALL_DERIVS)
+
+    ra  = self.register_backplane(('center_right_ascension',) + etc, ra)
+    dec = self.register_backplane(('center_declination',)     + etc, dec)
+    return (ra, dec)
 
 ################################################################################
 
@@ -163,9 +163,12 @@ class Event(object):
                 state = state.with_deriv('t', Vector3.ZERO)
 
         self._state_ = state.as_readonly()
-        self._pos_ = self._state_.without_deriv('t')
+        self._pos_ = None               # filled in when first needed
         self._origin_ = Event.PATH_CLASS.as_waypoint(origin)
-        self._frame_ = Frame.as_wayframe(frame) or origin.frame
+        if isinstance(origin, Event.PATH_CLASS):
+            self._frame_ = Frame.as_wayframe(frame) or origin.frame
+        else:
+            self._frame_ = Frame.as_wayframe(frame) or self._origin_.frame
 
         self._ssb_ = None
         self._xform_to_j2000_ = None
@@ -272,6 +275,10 @@ class Event(object):
     @property
     def pos(self):
         """Position without velocity as time-derivative."""
+
+        if self._pos_ is None:
+            self._pos_ = self._state_.without_deriv('t')
+
         return self._pos_
 
     @property
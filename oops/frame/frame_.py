@@ -23,6 +23,8 @@ class Frame(object):
     PATH_CLASS = None
 
     J2000 = None
+    # Frame IDs are looked up here directly; Frame.reset_registry() clears it
+    # between tests, so no other copy of this mapping is kept.
     WAYFRAME_REGISTRY = {}
     FRAME_CACHE = {}
     TEMPORARY_FRAME_ID = 10000
@@ -357,10 +359,10 @@ class Frame(object):
     def as_frame(frame):
         """The Frame object given the registered name or the object itself."""
 
-        if frame is None:
-            return None
         if isinstance(frame, Frame):
             return frame
+        if frame is None:
+            return None
 
         return Frame.WAYFRAME_REGISTRY[frame]
 
@@ -382,10 +384,10 @@ class Frame(object):
     def as_wayframe(frame):
         """The wayframe given a Frame or ID."""
 
-        if frame is None:
-            return None
         if isinstance(frame, Frame):
             return frame.wayframe
+        if frame is None:
+            return None
 
         return Frame.WAYFRAME_REGISTRY[frame]
 
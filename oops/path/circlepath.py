@@ -52,7 +52,7 @@ class CirclePath(Path):
         self.path_id = path_id
         self.origin  = Path.as_waypoint(origin)
         self.frame   = Frame.as_wayframe(frame) or self.origin.frame
-        self.keys    = set()
+        self.keys    = Path.EMPTY_KEYS
         self.shape   = Qube.broadcasted_shape(self.radius, self.lon,
                                               self.rate, self.epoch,
                                               self.origin.shape,
@@ -39,7 +39,7 @@ class CoordPath(Path):
         self.path_id = path_id
         self.origin  = self.surface.origin
         self.frame   = self.origin.frame
-        self.keys    = set()
+        self.keys    = Path.EMPTY_KEYS
         self.shape   = Qube.broadcasted_shape(self.surface, self.obs_path,
                                               *self.coords)
 
@@ -11,6 +11,10 @@ class FixedPath(Path):
     """A path described by fixed coordinates relative to another path and frame.
     """
 
+    __slots__ = ('pos',
+                 'waypoint', 'path_id', 'origin', 'frame', 'shape', 'keys',
+                 'ancestry', 'quickpaths')
+
     # Note: FixedPaths are not generally re-used, so their IDs are expendable.
     # Their IDs are not preserved during pickling.
 
@@ -20,7 +24,9 @@ class FixedPath(Path):
 
         Input:
             pos         a Vector3 of position vectors within the frame and
-                        relative to the specified origin.
+                        relative to the specified origin. A whole catalog of
+                        fixed points can be defined by a single Vector3 of
+                        shape (M,), which is evaluated in one call.
             origin      the path or ID of the reference point.
             frame       the frame or ID of the frame in which the position is
                         fixed.
@@ -37,7 +43,7 @@ class FixedPath(Path):
         self.path_id = path_id
         self.origin  = Path.as_waypoint(origin)
         self.frame   = Frame.as_wayframe(frame) or self.origin.frame
-        self.keys    = set()
+        self.keys    = Path.EMPTY_KEYS
         self.shape   = Qube.broadcasted_shape(self.pos, self.origin, self.frame)
 
         # Update waypoint and path_id; register only if necessary
@@ -164,7 +164,7 @@ class KeplerPath(Path, Fittable):
 
         self.path_id = path_id
         self.shape = ()
-        self.keys = set()
+        self.keys = Path.EMPTY_KEYS
         self.register(unpickled=unpickled)
 
         # Save in internal dict for name lookup upon serialization
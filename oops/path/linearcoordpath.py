@@ -40,7 +40,7 @@ class LinearCoordPath(Path):
         self.path_id = path_id
         self.origin  = self.surface.origin
         self.frame   = self.origin.frame
-        self.keys    = set()
+        self.keys    = Path.EMPTY_KEYS
         self.shape   = Qube.broadcasted_shape(self.surface, *self.coords,
                                               *self.coords_dot, self.epoch,
                                               self.obs_path)
@@ -67,11 +67,13 @@ class LinearCoordPath(Path):
                         and velocity on the path.
         """
 
+        dt = time - self.epoch
+
         new_coords = []
-        for i in range(len(self.coords)):
-            coord = self.coords[i] + self.coords_dot[i] * (time - self.epoch)
-            coord.insert_deriv('t', self.coords_dot[i])
-            new_coords.append(coord)
+        for (coord, coord_dot) in zip(self.coords, self.coords_dot):
+            new_coord = coord + coord_dot * dt
+            new_coord.insert_deriv('t', coord_dot)
+            new_coords.append(new_coord)
 
         new_coords = tuple(new_coords)
 
@@ -2,6 +2,8 @@
 # oops/path/linearpath.py: Subclass LinearPath of class Path
 ################################################################################
 
+import numpy as np
+
 from polymath          import Qube, Scalar, Vector3
 from oops.event        import Event
 from oops.frame.frame_ import Frame
@@ -10,6 +12,11 @@ from oops.path.path_   import Path
 class LinearPath(Path):
     """A path defining linear motion relative to another path and frame."""
 
+    __slots__ = ('pos', 'vel', 'epoch', '_epoch_f', '_pos_np', '_vel_np',
+                 '_plain', '_static',
+                 'waypoint', 'path_id', 'origin', 'frame', 'shape', 'keys',
+                 'ancestry', 'quickpaths')
+
     # Note: LinearPaths are not generally re-used, so their IDs are expendable.
     # Their IDs are not preserved during pickling.
 
@@ -38,30 +45,57 @@ class LinearPath(Path):
         else:
             pos = Vector3.as_vector3(pos)
 
-            if hasattr('d_dt', pos):
-                self.vel = pos.d_dt.as_readonly()
-            else:
+            vel = getattr(pos, 'd_dt', None)
+            if vel is None:
                 self.vel = Vector3.ZERO
+            else:
+                self.vel = vel.wod.as_readonly()
 
             self.pos = pos.wod.as_readonly()
 
         self.epoch = Scalar.as_scalar(epoch)
 
+        # Without masks or derivatives, event_at_time() can work directly on
+        # the NumPy arrays; a single epoch is kept as a Python float
+        if self.epoch.shape == ():
+            self._epoch_f = float(self.epoch.values)
+        else:
+            self._epoch_f = self.epoch.values
+
+        # Contiguous float64 arrays let NumPy use its fastest loops
+        self._pos_np = np.ascontiguousarray(self.pos.values, dtype=np.float64)
+        self._vel_np = np.ascontiguousarray(self.vel.values, dtype=np.float64)
+        self._pos_np.flags.writeable = False
+        self._vel_np.flags.writeable = False
+
+        self._plain = not (np.any(self.pos.mask) or np.any(self.vel.mask) or
+                           np.any(self.epoch.mask) or self.epoch.derivs)
+
+        # With zero velocity, the position is the same at every time
+        self._static = not (np.any(self._vel_np) or np.any(self.vel.mask))
+
         # Required attributes
         self.path_id = path_id
         self.origin  = Path.as_waypoint(origin)
         self.frame   = Frame.as_wayframe(frame) or self.origin.frame
-        self.keys    = set()
-        self.shape   = Qube.broadcasted_shape(self.pos, self.vel,
-                                              self.epoch,
-                                              self.origin, self.frame)
+        self.keys    = Path.EMPTY_KEYS
+
+        # Skip the general broadcast in the usual case of a single position
+        if (self.pos.shape == () and self.vel.shape == () and
+            self.epoch.shape == () and self.origin.shape == () and
+            self.frame.shape == ()):
+            self.shape = ()
+        else:
+            self.shape = Qube.broadcasted_shape(self.pos, self.vel,
+                                                self.epoch,
+                                                self.origin, self.frame)
 
         # Update waypoint and path_id; register only if necessary
         self.register()
 
     # Unpickled paths will always have temporary IDs to avoid conflicts
     def __getstate__(self):
-        return (self.pos, self.epoch,
+        return ((self.pos, self.vel), self.epoch,
                 Path.as_primary_path(self.origin),
                 Frame.as_primary_frame(self.frame))
 
@@ -79,7 +113,68 @@ class LinearPath(Path):
                         and velocity on the path.
         """
 
-        return Event(time, (self.pos + (time-self.epoch) * self.vel, self.vel),
-                           self.origin, self.frame)
+        # Plain numbers and arrays need no conversion to Scalar
+        if self._plain and not isinstance(time, Qube):
+            time_values = time
+        else:
+            time = Scalar.as_scalar(time)
+            if not self._plain or time.derivs or np.any(time.mask):
+                return Event(time, (self.pos + (time-self.epoch) * self.vel,
+                                    self.vel),
+                             self.origin, self.frame)
+
+            time_values = time.values
+
+        # With zero velocity, the position is the same at every time
+        if self._static:
+            shape = np.broadcast_shapes(np.shape(time_values),
+                                        np.shape(self._epoch_f),
+                                        self.pos.shape)
+            return Event(time, (self.pos.broadcast_to(shape), self.vel),
+                         self.origin, self.frame)
+
+        pos = self._pos_array(time_values)
+        return Event(time, (Vector3(pos), self.vel), self.origin, self.frame)
+
+    #===========================================================================
+    def pos_vel_arrays(self, time_values):
+        """Position and velocity as NumPy arrays at the given times.
+
+        This bypasses Event construction, for loops that need only the raw
+        vectors. Masks and derivatives are ignored.
+
+        Input:
+            time_values a number or NumPy array of times, seconds TDB.
+
+        Return:         a tuple (pos, vel) of arrays with a trailing dimension
+                        of 3. The velocity array is shared and read-only.
+        """
+
+        pos = self._pos_array(time_values)
+        if pos.shape == self._vel_np.shape:
+            return (pos, self._vel_np)
+
+        return (pos, np.broadcast_to(self._vel_np, pos.shape))
+
+    #===========================================================================
+    def _pos_array(self, time_values):
+        """Position as a NumPy array at the given times; see pos_vel_arrays().
+        """
+
+        # A single time and epoch need none of the broadcasting below, which
+        # would otherwise dominate the cost of this tiny calculation
+        if (isinstance(time_values, (float, int)) and
+            isinstance(self._epoch_f, float)):
+            return self._pos_np + (time_values - self._epoch_f) * self._vel_np
+
+        # Evaluate pos + dt * vel into a single new buffer
+        dt = (np.asarray(time_values) - self._epoch_f)[..., np.newaxis]
+        shape = np.broadcast_shapes(dt.shape, self._pos_np.shape,
+                                    self._vel_np.shape)
+        pos = np.empty(shape)
+        np.multiply(dt, self._vel_np, out=pos)
+        np.add(pos, self._pos_np, out=pos)
+
+        return pos
 
 ################################################################################
@@ -10,7 +10,11 @@ from oops.frame.frame_ import Frame
 from oops.path.path_   import Path
 
 class MultiPath(Path):
-    """Gathers a set of paths into a single 1-D Path object."""
+    """Gathers a set of paths into a single 1-D Path object.
+
+    Photon events solved against a MultiPath are solved for all of its paths
+    together, in a single vectorized iteration.
+    """
 
     PATH_IDS = {}
 
@@ -37,7 +41,7 @@ class MultiPath(Path):
 
         self.paths = np.array(paths, dtype='object').ravel()
         self.shape = self.paths.shape
-        self.keys = set()
+        self.keys = Path.EMPTY_KEYS
 
         for (index, path) in np.ndenumerate(self.paths):
             self.paths[index] = Path.as_path(path).wrt(self.origin, self.frame)
@@ -140,6 +144,12 @@ class MultiPath(Path):
             new_path = path.quick_path(time, quick=quick)
             new_paths.append(new_path)
 
-        return MultiPath(new_paths, self.origin, self.frame)
+        # If no path was replaced, avoid constructing a new MultiPath; this
+        # method is called on every iteration of the photon solver.
+        if all(new is old for (new, old) in zip(new_paths, self.paths)):
+            return self
+
+        # Don't let the approximation replace this path in the registry
+        return MultiPath(new_paths, self.origin, self.frame, path_id=None)
 
 ################################################################################
@@ -4,6 +4,7 @@
 
 import numpy as np
 import scipy.interpolate as interp
+import sys
 
 from polymath          import Qube, Scalar, Vector3
 from oops.config       import QUICK, PATH_PHOTONS, LOGGING, PICKLE_CONFIG
@@ -18,13 +19,24 @@ class Path(object):
     the Solar System Barycenter ("SSB") and the J2000 coordinate frame.
     """
 
+    # Subclasses that declare no __slots__ of their own still get a __dict__
+    __slots__ = ()
+
     # To avoid circular imports; filled in by oops/__init__.py
     BODY_CLASS = None           # filled in by body.py
 
+    # as_path() and as_waypoint() resolve an ID with one probe of this dict;
+    # they are not memoized, so an override registration takes effect at once.
     WAYPOINT_REGISTRY = {}
     PATH_CACHE = {}
     TEMPORARY_PATH_ID = 10000
 
+    # Shared by every path not yet cached under any key. The cache replaces it
+    # with a new set rather than modifying it, so it is never altered.
+    EMPTY_KEYS = frozenset()
+
+    DEBUG = False           # True to log iteration convergence steps
+
     ############################################################################
     # Each subclass must override...
     ############################################################################
@@ -58,6 +70,9 @@ class Path(object):
                             ...
                             self.ancestry[-1] = SSB in J2000.
 
+        Every path also provides this property, which is constructed when it is
+        first needed:
+
             wrt_ssb     a definition of the same path relative to the Solar
                         System Barycenter, in the J2000 coordinate frame.
         """
@@ -96,6 +111,12 @@ class Path(object):
     def frame_id(self):
         return self.frame.frame_id
 
+    @property
+    def wrt_ssb(self):
+        # Not built during registration; for registered paths, wrt() caches the
+        # result in the PATH_CACHE on first use.
+        return self.wrt(Path.SSB, Frame.J2000)
+
     # string operations
     def __str__(self):
         return (type(self).__name__ + '([' + self.path_id   + ' - ' +
@@ -205,6 +226,10 @@ class Path(object):
 
         If the path ID is None, blank, or begins with '.', this is treated as a
         temporary path and is not registered.
+
+        Registration takes time proportional to the depth of the path's
+        ancestry, so many paths can simply be registered one after another,
+        origins first. No path relative to the SSB is built here; see wrt_ssb.
         """
 
         # Make sure the registry is initialized
@@ -215,16 +240,9 @@ class Path(object):
 
         # Handle a shortcut
         if shortcut is not None:
-            if shortcut in Path.PATH_CACHE:
-                Path.PATH_CACHE[shortcut].keys -= {shortcut}
-            Path.PATH_CACHE[shortcut] = self
-            self.keys |= {shortcut}
-
-            key = (Path.WAYPOINT_REGISTRY[path_id], self.origin, self.frame)
-            if key in Path.PATH_CACHE:
-                Path.PATH_CACHE[key].keys -= {key}
-            Path.PATH_CACHE[key] = self
-            self.keys |= {key}
+            self._cache_under(shortcut)
+            self._cache_under((Path.WAYPOINT_REGISTRY[path_id], self.origin,
+                               self.frame))
 
             if not hasattr(self, 'waypoint') or self.waypoint is None:
                 self.waypoint = Path.WAYPOINT_REGISTRY[path_id]
@@ -246,6 +264,11 @@ class Path(object):
         _ = Path.WAYPOINT_REGISTRY[self.origin.path_id]
         _ = Path.PATH_CACHE[self.origin]
 
+        # Intern the ID so that registry lookups usually reduce to an identity
+        # comparison of strings
+        path_id = sys.intern(path_id)
+        self.path_id = path_id
+
         # If the ID is unregistered, insert this as a primary definition
         if (path_id not in Path.WAYPOINT_REGISTRY) or override:
 
@@ -272,19 +295,6 @@ class Path(object):
             for key in waypoint.keys:
                 Path.PATH_CACHE[key] = waypoint
 
-            # Also define the path with respect to the SSB
-            if self.origin == Path.SSB and self.frame == Frame.J2000:
-                self.wrt_ssb = self
-            else:
-                self.wrt_ssb = self.wrt(Path.SSB, Frame.J2000)
-
-                self.wrt_ssb.keys = {(waypoint, Path.SSB, Frame.J2000)}
-                if self.origin != Path.SSB:
-                    self.wrt_ssb.keys |= {(waypoint, Path.SSB)}
-
-                for key in self.wrt_ssb.keys:
-                    Path.PATH_CACHE[key] = self.wrt_ssb
-
         # Otherwise, just insert secondary definitions
         else:
             if not hasattr(self, 'waypoint') or self.waypoint is None:
@@ -294,32 +304,33 @@ class Path(object):
             # any of the standard keys.
             if not unpickled:
                 # Cache (self.waypoint, self.origin); overwrite if necessary
-                key = (self.waypoint, self.origin)
-                if key in Path.PATH_CACHE:          # remove an old version
-                    Path.PATH_CACHE[key].keys -= {key}
-
-                Path.PATH_CACHE[key] = self
-                self.keys |= {key}
+                self._cache_under((self.waypoint, self.origin))
 
                 # Cache (self.waypoint, self.origin, self.frame)
-                key = (self.waypoint, self.origin, self.frame)
-                if key in Path.PATH_CACHE:          # remove an old version
-                    Path.PATH_CACHE[key].keys -= {key}
+                self._cache_under((self.waypoint, self.origin, self.frame))
 
-                Path.PATH_CACHE[key] = self
-                self.keys |= {key}
+    #===========================================================================
+    def _cache_under(self, key):
+        """Cache this path under the given key, replacing any previous path."""
+
+        old_path = Path.PATH_CACHE.get(key)
+        if old_path is not None:            # remove an old version
+            old_path.keys -= {key}
+
+        Path.PATH_CACHE[key] = self
+        self.keys |= {key}
 
     #===========================================================================
     @staticmethod
     def as_path(path):
         """The Path object given the ID or the object itself."""
 
-        if path is None:
-            return None
-
         if isinstance(path, Path):
             return path
 
+        if path is None:
+            return None
+
         return Path.WAYPOINT_REGISTRY[path]
 
     #===========================================================================
@@ -340,12 +351,12 @@ class Path(object):
     def as_waypoint(path):
         """The waypoint given a Path or ID."""
 
-        if path is None:
-            return None
-
         if isinstance(path, Path):
             return path.waypoint
 
+        if path is None:
+            return None
+
         return Path.WAYPOINT_REGISTRY[path]
 
     #===========================================================================
@@ -653,7 +664,7 @@ class Path(object):
 
         # Define quantities with respect to SSB in J2000
         link_wrt_ssb = link.wrt_ssb(derivs=derivs, quick=quick)
-        path_wrt_ssb = self.wrt(Path.SSB, Frame.J2000)
+        path_wrt_ssb = self.wrt_ssb
 
         # Prepare for iteration, avoiding any derivatives for now
         link_time = link.time.wod
@@ -671,8 +682,8 @@ class Path(object):
             path_time = link_time + lt
 
         # Set light travel time limits to avoid a diverging solution
-        lt_min = (path_time - link_time).min() - limit
-        lt_max = (path_time - link_time).max() + limit
+        lt_min = lt.min() - limit
+        lt_max = lt.max() + limit
 
         lt_min = lt_min.as_builtin()
         lt_max = lt_max.as_builtin()
@@ -687,6 +698,7 @@ class Path(object):
         max_dlt = np.inf
         prev_lt = None
         converged = False
+        log_iterations = LOGGING.path_iterations or Path.DEBUG
         for count in range(iters):
 
             # Quicken the path and frame evaluations on first iteration
@@ -698,8 +710,12 @@ class Path(object):
             delta_pos_ssb = path_event_ssb.pos.wod - link_pos_ssb
             delta_vel_ssb = path_event_ssb.vel.wod - link_vel_ssb
 
-            dlt = ((delta_pos_ssb.norm() - lt * signed_c) /
-                   (delta_vel_ssb.proj(delta_pos_ssb).norm() - signed_c))
+            # The outward speed |proj(delta_vel, delta_pos)| is evaluated as
+            # |delta_vel . delta_pos| / |delta_pos|, re-using the distance
+            distance = delta_pos_ssb.norm()
+            outward_speed = delta_vel_ssb.dot(delta_pos_ssb).abs() / distance
+
+            dlt = ((distance - lt * signed_c) / (outward_speed - signed_c))
             new_lt = (lt - dlt).clip(lt_min, lt_max, remask=False)
             dlt = lt - new_lt
 
@@ -713,8 +729,8 @@ class Path(object):
             prev_max_dlt = max_dlt
             max_dlt = abs(dlt).max(builtins=True, masked=-1.)
 
-            if LOGGING.surface_iterations:
-                LOGGING.performance('Path._solve_photon',
+            if log_iterations:
+                LOGGING.convergence('Path._solve_photon',
                                     'iter=%d; change=%.6g' % (count+1, max_dlt))
 
             if max_dlt <= precision:
@@ -752,14 +768,13 @@ class Path(object):
 
         # Construct the returned event
         path_event_ssb = path_wrt_ssb.event_at_time(path_time, quick=quick)
-        link_event_ssb = link_wrt_ssb.copy()
 
         # Fill in the key subfields
         if sign > 0:
             ray_vector_ssb = (path_event_ssb.state -
-                              link_event_ssb.state).as_readonly()
+                              link_wrt_ssb.state).as_readonly()
         else:
-            ray_vector_ssb = (link_event_ssb.state -
+            ray_vector_ssb = (link_wrt_ssb.state -
                               path_event_ssb.state).as_readonly()
 
         lt = ray_vector_ssb.norm(recursive=derivs) / signed_c
@@ -825,20 +840,18 @@ class Path(object):
                 return RotatedPath(newpath, frame)
 
         # If the path already exists, just return it
-        key = (self.waypoint, origin.waypoint, frame)
-        if key in Path.PATH_CACHE:
-            return Path.PATH_CACHE[key]
+        newpath = Path.PATH_CACHE.get((self.waypoint, origin.waypoint, frame))
+        if newpath is not None:
+            return newpath
 
         # If everything matches but the frame, return a RotatedPath
-        key = (self.waypoint, origin.waypoint)
-        if key in Path.PATH_CACHE:
-            newpath = Path.PATH_CACHE[key]
+        newpath = Path.PATH_CACHE.get((self.waypoint, origin.waypoint))
+        if newpath is not None:
             return RotatedPath(newpath, frame)
 
         # Look up the primary definition of this path
-        try:
-            path = Path.as_primary_path(self)
-        except KeyError:
+        path = Path.PATH_CACHE.get(self.waypoint)
+        if path is None:
             # On failure, link from the origin path
             newpath = LinkedPath(self, self.origin.wrt(origin))
             if newpath.frame == frame:
@@ -847,9 +860,8 @@ class Path(object):
                 return RotatedPath(newpath, frame)
 
         # Look up the primary definition of the origin path
-        try:
-            origin = Path.as_primary_path(origin)
-        except KeyError:
+        primary_origin = Path.PATH_CACHE.get(origin.waypoint)
+        if primary_origin is None:
             # On failure, link through the origin's origin
             newpath = RelativePath(path.wrt(origin.origin, frame), origin)
             if newpath.frame == frame:
@@ -857,6 +869,8 @@ class Path(object):
             else:
                 return RotatedPath(newpath, frame)
 
+        origin = primary_origin
+
         # If the path is an ancestor of the origin, reverse the direction and
         # try again
         if path in origin.ancestry:
@@ -1010,6 +1024,13 @@ class Waypoint(Path):
     A Waypoint cannot be registered.
     """
 
+    __slots__ = ('waypoint', 'origin', 'frame', 'path_id', 'shape', 'keys',
+                 'ancestry')
+
+    # The zero state vector shared by every Waypoint event, already including
+    # its zero velocity as the time-derivative
+    ZERO_STATE = Vector3.ZERO.with_deriv('t', Vector3.ZERO).as_readonly()
+
     def __init__(self, path_id, frame=None, shape=()):
         """Constructor for a Waypoint.
 
@@ -1023,9 +1044,9 @@ class Waypoint(Path):
         self.waypoint = self
         self.origin   = self
         self.frame    = Frame.as_wayframe(frame) or Frame.J2000
-        self.path_id  = path_id
+        self.path_id  = sys.intern(path_id)
         self.shape    = shape
-        self.keys     = set()
+        self.keys     = Path.EMPTY_KEYS
 
     def __getstate__(self):
         # A path might not get assigned the same ID on the next run of OOPS, so
@@ -1042,7 +1063,7 @@ class Waypoint(Path):
                       primary_path.shape)
 
     def event_at_time(self, time, quick={}):
-        return Event(time, Vector3.ZERO, self.origin, self.frame)
+        return Event(time, Waypoint.ZERO_STATE, self.origin, self.frame)
 
     # Registration does nothing
     def register(self):
@@ -1088,7 +1109,7 @@ class AliasPath(Path):
         self.frame    = frame.wayframe
         self.shape    = Qube.broadcasted_shape(self.path.shape,
                                                self.frame.shape)
-        self.keys     = set()
+        self.keys     = Path.EMPTY_KEYS
 
     def __getstate__(self):
         return (self.path, self.frame)
@@ -1115,6 +1136,10 @@ class LinkedPath(Path):
     the parent and in the parent's frame.
     """
 
+    __slots__ = ('path', 'parent', 'rotation',
+                 'waypoint', 'path_id', 'origin', 'frame', 'shape', 'keys',
+                 'ancestry', 'quickpaths')
+
     def __init__(self, path, parent):
         """Constructor for a Linked Path.
 
@@ -1131,6 +1156,9 @@ class LinkedPath(Path):
             raise ValueError('LinkedPath paths are incompatible: %s, %s'
                              % (path, parent))
 
+        # A single rotation suffices; Frame.wrt() does any composing. Frames
+        # with a fixed rotation already return a prebuilt Transform, and
+        # fittable frames can change, so the Transform is not cached here.
         if self.path.frame == self.parent.frame:
             self.rotation = None
         else:
@@ -1142,7 +1170,7 @@ class LinkedPath(Path):
         self.origin   = parent.origin
         self.frame    = parent.frame
         self.shape    = Qube.broadcasted_shape(path.shape, parent.shape)
-        self.keys     = set()
+        self.keys     = Path.EMPTY_KEYS
 
         if path.is_registered() and parent.is_registered():
             self.register()     # save for later use
@@ -1156,6 +1184,33 @@ class LinkedPath(Path):
     def event_at_time(self, time, quick={}):
         event = self.path.event_at_time(time, quick=quick)
 
+        # Without subfields to carry along, walk down any chain of LinkedPaths
+        # and sum the states directly, constructing only the final Event
+        if not event.subfields:
+            time = event.time
+            states = []
+            link = self
+            while True:
+                state = event.state
+                if link.rotation is not None:
+                    xform = link.rotation.transform_at_time(time, quick=quick)
+                    state = xform.unrotate(state, derivs=True)
+
+                states.append(state)
+
+                link = link.parent
+                if not isinstance(link, LinkedPath):
+                    break
+
+                event = link.path.event_at_time(time, quick=quick)
+
+            # Sum from the root, in the same order as nested additions
+            state = link.event_at_time(time, quick=quick).state
+            for link_state in states[::-1]:
+                state = link_state + state
+
+            return Event(time, state, self.origin, self.frame)
+
         if self.rotation is not None:
             event = event.unrotate_by_frame(self.rotation, quick=quick)
 
@@ -1169,6 +1224,10 @@ class RelativePath(Path):
     The new path uses the coordinate frame of the origin path.
     """
 
+    __slots__ = ('path', 'new_origin', 'rotation',
+                 'waypoint', 'path_id', 'origin', 'frame', 'shape', 'keys',
+                 'ancestry', 'quickpaths')
+
     def __init__(self, path, origin):
         """Constructor for a RelativePath.
 
@@ -1198,7 +1257,7 @@ class RelativePath(Path):
         self.origin   = self.new_origin.waypoint
         self.frame    = self.new_origin.frame
         self.shape    = Qube.broadcasted_shape(path.shape, origin.shape)
-        self.keys     = set()
+        self.keys     = Path.EMPTY_KEYS
 
         if path.is_registered() and origin.is_registered():
             self.register()     # save for later use
@@ -1223,6 +1282,10 @@ class ReversedPath(Path):
     """ReversedPath generates the reversed Events from that of a given Path.
     """
 
+    __slots__ = ('path',
+                 'waypoint', 'path_id', 'origin', 'frame', 'shape', 'keys',
+                 'ancestry', 'quickpaths')
+
     def __init__(self, path):
         """Constructor for a ReversedPath.
 
@@ -1238,19 +1301,23 @@ class ReversedPath(Path):
         self.origin   = self.path.waypoint
         self.frame    = self.path.frame
         self.shape    = self.path.shape
-        self.keys     = set()
+        self.keys     = Path.EMPTY_KEYS
 
         if path.is_registered():
             self.register()     # save for later use
 
     def __getstate__(self):
-        return (self.path)
+        return (self.path,)
 
     def __setstate__(self, state):
         self.__init__(*state)
 
     def event_at_time(self, time, quick={}):
         event = self.path.event_at_time(time, quick=quick)
+
+        # One negation of the state reverses the position and velocity
+        # together. It cannot be done in place, because paths such as FixedPath
+        # return events that share their read-only state vectors.
         return Event(event.time, -event.state, self.origin, self.frame)
 
 ################################################################################
@@ -1259,6 +1326,10 @@ class RotatedPath(Path):
     """RotatedPath returns event objects rotated to another coordinate frame.
     """
 
+    __slots__ = ('path', 'rotation',
+                 'waypoint', 'path_id', 'origin', 'frame', 'shape', 'keys',
+                 'ancestry', 'quickpaths')
+
     def __init__(self, path, frame):
         """Constructor for a RotatedPath.
 
@@ -1269,28 +1340,50 @@ class RotatedPath(Path):
         """
 
         self.path = Path.as_path(path)
-        self.rotation = Frame.as_frame(frame).wrt(path.frame)
+
+        frame = Frame.as_frame(frame)
+        if frame.wayframe == self.path.frame:
+            self.rotation = None
+        else:
+            self.rotation = frame.wrt(self.path.frame)
 
         # Required attributes
-        self.waypoint = path.waypoint
-        self.path_id  = path.path_id
-        self.origin   = path.origin
-        self.frame    = self.rotation.wayframe
-        self.shape    = path.shape
-        self.keys     = set()
+        self.waypoint = self.path.waypoint
+        self.path_id  = self.path.path_id
+        self.origin   = self.path.origin
+        self.frame    = frame.wayframe
+        self.shape    = self.path.shape
+        self.keys     = Path.EMPTY_KEYS
 
-        if path.is_registered():
+        if self.path.is_registered():
             self.register()     # save for later use
 
     def __getstate__(self):
-        return (self.path, self.rotation)
+        return (self.path, self.frame)
 
     def __setstate__(self, state):
         self.__init__(*state)
 
     def event_at_time(self, time, quick={}):
         event = self.path.event_at_time(time, quick=quick)
-        return event.rotate_by_frame(self.rotation, quick=quick)
+
+        if self.rotation is None:
+            return event
+
+        if event.subfields:
+            return event.rotate_by_frame(self.rotation, quick=quick)
+
+        xform = self.rotation.transform_at_time(event.time, quick=quick)
+
+        # With velocity as the only derivative, rotate the position and the
+        # velocity directly, skipping the time-derivative of the matrix
+        state = event.state
+        if len(state.derivs) == 1 and not state.d_dt.derivs:
+            (pos, vel) = xform.rotate_pos_vel(event.pos, state.d_dt)
+            return Event(event.time, (pos, vel), event.origin, self.frame)
+
+        return Event(event.time, xform.rotate(state, derivs=True),
+                     event.origin, self.frame)
 
 ################################################################################
 
@@ -1318,7 +1411,7 @@ class QuickPath(Path):
         self.origin   = path.origin
         self.frame    = path.frame
         self.shape    = ()
-        self.keys     = set()
+        self.keys     = Path.EMPTY_KEYS
 
         self.t0 = interval[0]
         self.t1 = interval[1]
@@ -1521,7 +1614,6 @@ class QuickPath(Path):
 # Initialize Path.SSB
 Path.SSB = Waypoint('SSB')
 Path.SSB.ancestry = []
-Path.SSB.wrt_ssb = Path.SSB
 
 # Initialize the registry
 Path.initialize_registry()
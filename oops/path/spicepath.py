@@ -93,7 +93,7 @@ class SpicePath(Path):
 
         # No shape, no keys
         self.shape = ()
-        self.keys = set()
+        self.keys = Path.EMPTY_KEYS
         self.shortcut = shortcut
 
         # Register the SpicePath; fill in the waypoint
@@ -55,8 +55,7 @@ class CentricEllipsoid(Ellipsoid):
             (track, p) = self.intercept_normal_to(pos, guess=True)
         else:
             p = Scalar.as_scalar(hints, recursive=derivs)
-            denom = Vector3.ONES + p * self.unsquash_sq
-            track = pos.element_div(denom)
+            track = self._track_from_hints(pos, p)
 
         # Derive the coordinates
         (x,y,z) = track.to_scalars()
@@ -2,6 +2,7 @@
 # oops/surface/ellipsoid.py: Ellipsoid subclass of class Surface
 ################################################################################
 
+import math
 import numpy as np
 
 from polymath              import Matrix, Scalar, Vector3
@@ -32,6 +33,8 @@ class Ellipsoid(Surface):
 
     DEBUG = False       # True for convergence testing in intercept_normal_to()
 
+    INTERCEPT_BLOCKSIZE = 4096  # elements per block in intercept() arrays
+
     #===========================================================================
     def __init__(self, origin, frame, radii, exclusion=0.9):
         """Constructor for an Ellipsoid object.
@@ -79,6 +82,44 @@ class Ellipsoid(Surface):
                                       [0.,self.unsquash_y**2,0.],
                                       [0.,0.,self.unsquash_z**2]))
 
+        # Coefficients of the polynomial in p solved by intercept_normal_to()
+        # that depend only on the shape; see the derivation there. The two
+        # leading coefficients are constants. Each tuple in _poly_xyzr holds
+        # the multipliers of X, Y, Z and the constant subtracted for each of
+        # the remaining coefficients except the last, which is X + Y + Z - R.
+        B = self.unsquash_y_sq
+        C = self.unsquash_z_sq
+        R = self.req_sq
+        B2 = B**2
+        C2 = C**2
+
+        if B == 1.:
+            # With a == b, the sixth-order polynomial has a factor (1+p)**2;
+            # dividing it out leaves a quartic
+            self._poly_leading = (-C2 * R, -2 * R * (C2 + C))
+            self._poly_xyzr = (
+                (C2, C2, 1., R * (C2 + 4*C + 1)),
+                (2*C, 2*C, 2., 2 * R * (C + 1)))
+        else:
+            self._poly_leading = (-B2 * C2 * R,
+                                  -2 * R * (B2*C2 + B2*C + B*C2))
+            self._poly_xyzr = (
+                (B2*C2, C2, B2,
+                 R * (B2*C2 + 4*B2*C + 4*B*C2 + 4*B*C + B2 + C2)),
+                (2*(B2*C + B*C2), 2*(C2 + C), 2*(B2 + B),
+                 2 * R * (B2*C + B*C2 + 4*B*C + B2 + C2 + B + C)),
+                (B2 + 4*B*C + C2, C2 + 4*C + 1, B2 + 4*B + 1,
+                 R * (B2 + 4*B*C + C2 + 4*B + 4*C + 1)),
+                (2*B + 2*C, 2*C + 2, 2*B + 2,
+                 2 * R * (B + C + 1)))
+
+        degree = len(self._poly_xyzr) + 2
+        self._dpoly_leading = (degree * self._poly_leading[0],
+                               (degree - 1) * self._poly_leading[1])
+
+        # For a sphere, intercept_normal_to() has a closed-form solution
+        self._is_sphere = bool(np.all(self.radii == self.req))
+
         # This is the exclusion zone radius, within which calculations of
         # intercept_normal_to() are automatically masked due to the ill-defined
         # geometry.
@@ -87,11 +128,11 @@ class Ellipsoid(Surface):
 
         self.unmasked = self
 
-        # Unique key for intercept calculations
+        # Unique key for intercept calculations; radii are Python floats
         self.intercept_key = ('ellipsoid', self.origin.waypoint,
                                            self.frame.wayframe,
-                                           tuple(self.radii),
-                                           self.exclusion)
+                                           tuple(float(r) for r in self.radii),
+                                           float(self.exclusion))
 
     def __getstate__(self):
         return (Path.as_primary_path(self.origin),
@@ -144,19 +185,29 @@ class Ellipsoid(Surface):
             (track, p) = self.intercept_normal_to(pos, derivs=derivs, guess=True)
         else:
             p = Scalar.as_scalar(hints, recursive=derivs)
-            denom = Vector3.ONES + p * self.unsquash_sq
-            track = pos.element_div(denom)
+            track = self._track_from_hints(pos, p)
 
         # Derive the coordinates
-        track_unsquashed = track.element_mul(self.unsquash)
-        (x,y,z) = track_unsquashed.to_scalars()
-        lat = (z/self.req).arcsin()
-        lon = y.arctan2(x) % Scalar.TWOPI
+        if track.derivs:
+            track_unsquashed = track.element_mul(self.unsquash)
+            (x,y,z) = track_unsquashed.to_scalars()
+            lat = (z/self.req).arcsin()
+            lon = y.arctan2(x) % Scalar.TWOPI
+        else:
+            (lon, lat) = self._lon_lat_arrays(track)
 
         results = (lon, lat)
 
         if axes == 3:
-            r = (pos - track).norm() * p.sign()
+            if track.derivs or p.derivs:
+                r = (pos - track).norm() * p.sign()
+            else:
+                diff = pos.vals - track.vals
+                diff *= diff
+                mask = np.logical_or(np.logical_or(pos.mask, track.mask),
+                                     p.mask)
+                r = Scalar(np.sqrt(np.sum(diff, axis=-1)) * np.sign(p.vals),
+                           mask)
             results += (r,)
 
         if groundtrack:
@@ -164,6 +215,61 @@ class Ellipsoid(Surface):
 
         return results
 
+    #===========================================================================
+    def _lon_lat_arrays(self, track):
+        """Longitude and latitude of ground track points without derivatives.
+
+        This matches the polymath calculation in coords_from_vector3(),
+        including the masking of any arcsine argument outside [-1,1], but
+        operates directly on the ndarrays.
+        """
+
+        # The x-axis is never rescaled, so only y and z are unsquashed
+        (_, unsquash_y, unsquash_z) = self.unsquash.vals
+        track_vals = track.vals
+        sin_lat = track_vals[..., 2] * unsquash_z / self.req
+
+        lat_mask = track.mask
+        outside = (sin_lat < -1.) | (sin_lat > 1.)
+        if np.any(outside):
+            sin_lat = np.where(outside, 0., sin_lat)
+            lat_mask = np.logical_or(lat_mask, outside)
+
+        # For an oblate body, the y-axis is not rescaled either
+        track_y = track_vals[..., 1]
+        if unsquash_y != 1.:
+            track_y = track_y * unsquash_y
+
+        lon = np.arctan2(track_y, track_vals[..., 0]) % Scalar.TWOPI
+        return (Scalar(lon, track.mask), Scalar(np.arcsin(sin_lat), lat_mask))
+
+    #===========================================================================
+    def _track_from_hints(self, pos, p):
+        """The surface intercept given the coefficient p such that
+            track + p * normal(track) = pos.
+
+        Without derivatives, this avoids the intermediate Vector3 objects and
+        does the division directly on the ndarrays.
+        """
+
+        if pos.derivs or p.derivs:
+            denom = Vector3.ONES + p * self.unsquash_sq
+            return pos.element_div(denom)
+
+        denom = 1. + np.asarray(p.vals)[..., np.newaxis] * self.unsquash_sq.vals
+
+        mask = np.logical_or(pos.mask, p.mask)
+        zeros = (denom == 0.)
+        if np.any(zeros):
+            mask = mask | np.any(zeros, axis=-1)
+
+        # Reuse the denominator array for the result where the shapes allow
+        out = denom if denom.shape == pos.vals.shape else None
+        with np.errstate(divide='ignore', invalid='ignore'):
+            track = np.divide(pos.vals, denom, out=out)
+
+        return Vector3(track, mask if np.any(mask) else False)
+
     #===========================================================================
     def vector3_from_coords(self, coords, obs=None, time=None, derivs=False,
                                           groundtrack=False):
@@ -200,17 +306,38 @@ class Ellipsoid(Surface):
         # Determine groundtrack
         lon = Scalar.as_scalar(coords[0], derivs)
         lat = Scalar.as_scalar(coords[1], derivs)
-        track_unsquashed = Vector3.from_ra_dec_length(lon, lat, self.req)
-        track = track_unsquashed.element_mul(self.squash)
+        if lon.derivs or lat.derivs:
+            track_unsquashed = Vector3.from_ra_dec_length(lon, lat, self.req)
+            track = track_unsquashed.element_mul(self.squash)
+
+        else:
+            # Spherical to Cartesian directly, with the squash folded into the
+            # radius along each axis
+            (lon_vals, lat_vals) = np.broadcast_arrays(lon.vals, lat.vals)
+            cos_lat = np.cos(lat_vals)
+            track = np.empty(lon_vals.shape + (3,))
+            track[..., 0] = cos_lat * np.cos(lon_vals)
+            track[..., 1] = cos_lat * np.sin(lon_vals)
+            track[..., 2] = np.sin(lat_vals)
+            track *= self.req * self.squash.vals
+            track = Vector3(track, np.logical_or(lon.mask, lat.mask))
 
         # Assemble results
         if len(coords) == 2:
             results = (track, track)
 
         else:
-            # Add the z-component
-            normal = self.normal(track)
-            results = (track + (coords[2] / normal.norm()) * normal, track)
+            # Add the z-component along the unit normal
+            z = Scalar.as_scalar(coords[2])
+            if track.derivs or z.derivs:
+                normal = self.normal(track)
+                results = (track + (z / normal.norm()) * normal, track)
+            else:
+                normal = track.vals * self.unsquash_sq.vals
+                scale = z.vals / np.sqrt(np.sum(normal * normal, axis=-1))
+                pos = track.vals + scale[..., np.newaxis] * normal
+                results = (Vector3(pos, np.logical_or(track.mask, z.mask)),
+                           track)
 
         if groundtrack:
             return results
@@ -233,8 +360,9 @@ class Ellipsoid(Surface):
         Return:         Boolean True where positions are inside the surface
         """
 
-        unsquashed = Vector3.as_vector3(pos).element_mul(self.unsquash)
-        return unsquashed.norm() < self.radii[0]
+        pos = Vector3.as_vector3(pos, recursive=False)
+        unsquashed = pos.element_mul(self.unsquash)
+        return unsquashed.norm_sq() < self.req_sq
 
     #===========================================================================
     def intercept(self, obs, los, time=None, direction='dep', derivs=False,
@@ -268,9 +396,6 @@ class Ellipsoid(Surface):
         obs = Vector3.as_vector3(obs, recursive=derivs)
         los = Vector3.as_vector3(los, recursive=derivs)
 
-        obs_unsquashed = obs.element_mul(self.unsquash)
-        los_unsquashed = los.element_mul(self.unsquash)
-
         # Solve for the intercept distance, masking lines of sight that miss
         #   pos = obs + t * los
         #   pos**2 = radius**2 [after "unsquash"]
@@ -312,6 +437,14 @@ class Ellipsoid(Surface):
         # This is the preferred solution, because b and sqrt(d) usually have
         # opposite signs, so they generally do not cancel.
 
+        # Without derivatives, solve directly on the ndarrays, avoiding the
+        # intermediate polymath objects
+        if not (obs.derivs or los.derivs):
+            return self._intercept_arrays(obs, los, direction, hints)
+
+        obs_unsquashed = obs.element_mul(self.unsquash)
+        los_unsquashed = los.element_mul(self.unsquash)
+
         # This is the same formula as above, but avoids a few multiplies by 2
         a      = los_unsquashed.dot(los_unsquashed)
         b_div2 = los_unsquashed.dot(obs_unsquashed)
@@ -330,6 +463,95 @@ class Ellipsoid(Surface):
 
         return (pos, t)
 
+    #===========================================================================
+    def _intercept_arrays(self, obs, los, direction, hints):
+        """Internal version of intercept() for inputs without derivatives.
+
+        The math is the same, but it operates on the ndarrays so that only the
+        final Vector3 and Scalar objects are constructed.
+
+        Large inputs are processed in blocks of INTERCEPT_BLOCKSIZE elements.
+        NumPy makes a separate pass over the data for each operation, and this
+        keeps the temporaries of every pass resident in cache.
+        """
+
+        obs_vals = obs.vals
+        los_vals = los.vals
+        shape = np.broadcast_shapes(obs_vals.shape, los_vals.shape)[:-1]
+        size = math.prod(shape)
+
+        # Below a few blocks, the loop overhead outweighs the cache benefit
+        blocksize = Ellipsoid.INTERCEPT_BLOCKSIZE
+        if size <= 4 * blocksize:
+            (pos, t, mask) = self._intercept_block(obs_vals, los_vals,
+                                                   direction)
+        else:
+            obs_vals = np.broadcast_to(obs_vals, shape + (3,)).reshape(-1,3)
+            los_vals = np.broadcast_to(los_vals, shape + (3,)).reshape(-1,3)
+
+            pos = np.empty((size,3))
+            t = np.empty(size)
+            mask = np.empty(size, dtype='bool')
+            for start in range(0, size, blocksize):
+                block = slice(start, start + blocksize)
+                (pos[block], t[block],
+                 mask[block]) = self._intercept_block(obs_vals[block],
+                                                      los_vals[block],
+                                                      direction)
+
+            pos = pos.reshape(shape + (3,))
+            t = t.reshape(shape)
+            mask = mask.reshape(shape)
+
+        mask = np.logical_or(mask, np.logical_or(obs.mask, los.mask))
+        if not np.any(mask):
+            mask = False
+
+        pos = Vector3(pos, mask)
+        t = Scalar(t, mask)
+
+        if hints is not None:
+            return (pos, t, hints)
+
+        return (pos, t)
+
+    #===========================================================================
+    def _intercept_block(self, obs_vals, los_vals, direction):
+        """The ndarray calculation of _intercept_arrays() for one block.
+
+        Return:         (pos, t, mask), where mask is True where the line of
+                        sight misses the surface or is degenerate.
+        """
+
+        # The dot products of the unsquashed vectors are the dot products of
+        # the originals weighted by unsquash_sq, so the unsquashed vectors
+        # themselves are never needed. (Under NumPy, a matrix product over the
+        # interleaved (...,3) arrays is faster than splitting them into
+        # separate x, y and z arrays first.)
+        weights = self.unsquash_sq.vals
+
+        a      = (los_vals * los_vals) @ weights
+        b_div2 = (los_vals * obs_vals) @ weights
+        c      = (obs_vals * obs_vals) @ weights - self.req_sq
+        d_div4 = b_div2**2 - a * c
+
+        mask = (d_div4 < 0.)
+        with np.errstate(divide='ignore', invalid='ignore'):
+            sqrt_d_div4 = np.sqrt(d_div4)
+            if direction == 'dep':              # Case 1
+                denom = b_div2 + sqrt_d_div4
+                t = -c / denom
+            else:                               # Case 2
+                denom = a
+                t = (sqrt_d_div4 - b_div2) / a
+
+            # Scale los first so obs can be added in place
+            pos = t[..., np.newaxis] * los_vals
+            pos += obs_vals
+
+        mask |= (denom == 0.)
+        return (pos, t, mask)
+
     #===========================================================================
     def normal(self, pos, time=None, derivs=False):
         """The normal vector at a position at or near a surface.
@@ -399,6 +621,17 @@ class Ellipsoid(Surface):
         """
 
         pos = Vector3.as_vector3(pos, recursive=derivs)
+
+        if self._is_sphere:
+            return self._intercept_normal_to_sphere(self._apply_exclusion(pos),
+                                                    guess)
+
+        # A single position without derivatives is solved using Python floats
+        if pos.shape == () and not pos.derivs and not pos.mask:
+            result = self._intercept_normal_to_float(pos, guess)
+            if result is not None:
+                return result
+
         pos = self._apply_exclusion(pos)
 
         # We need to solve for p such that:
@@ -457,29 +690,15 @@ class Ellipsoid(Surface):
         #      - R + X + Y + Z
         #
         # Let f(p) = (((((f6*p + f5)*p + f4)*p + f3)*p + f2)*p + f1)*p + f0
-
-        B2 = B**2
-        C2 = C**2
-
-        # For efficiency, we segregate all the array ops (involving X, Y, Z)
-        f6 = -B2 * C2 * R
-        f5 = -2 * R * (B2*C2 + B2*C + B*C2)
-        f4 = (X * (B2*C2) + Y * C2 + Z * B2
-              - R * (B2*C2 + 4*B2*C + 4*B*C2 + 4*B*C + B2 + C2))
-        f3 = (X * (2*(B2*C + B*C2)) + Y * (2*(C2 + C)) + Z * (2*(B2 + B))
-              - 2 * R * (B2*C + B*C2 + 4*B*C + B2 + C2 + B + C))
-        f2 = (X * (B2 + 4*B*C + C2) + Y * (C2 + 4*C + 1) + Z * (B2 + 4*B + 1)
-              - R * (B2 + 4*B*C + C2 + 4*B + 4*C + 1))
-        f1 = (X * (2*B + 2*C) + Y * (2*C + 2) + Z * (2*B + 2)
-              - 2 * R * (B + C + 1))
-        f0 = X + Y + Z - R
-
-        g5 = 6 * f6
-        g4 = 5 * f5
-        g3 = 4 * f4
-        g2 = 3 * f3
-        g1 = 2 * f2
-        g0 = f1
+        #
+        # When B == 1, f(p) has a factor of (1+p)**2. Dividing it out leaves a
+        # quartic, the same one solved by Spheroid, which is cheaper to
+        # evaluate and has the same root.
+        #
+        # The parts that depend only on (B,C,R) are precomputed in the
+        # constructor; only the array ops involving X, Y, Z remain here.
+        (f_coeffs, df_coeffs) = self._poly_coefficients(X, Y, Z)
+        f0 = f_coeffs[-1]
 
         # Make an initial guess at p
         if isinstance(guess, (type(None), bool, np.bool_)):
@@ -507,6 +726,48 @@ class Ellipsoid(Surface):
         km_scale = self.req
         precision = SURFACE_PHOTONS.km_precision / km_scale
 
+        # Iterate on the raw ndarrays; this avoids the overhead of polymath
+        # operator dispatch inside the loop. Any division by zero yields a
+        # non-finite p, which is masked afterward. Derivatives, if any, are
+        # added by one final Newton step in polymath.
+        #
+        # On this path, elements whose Newton step has already fallen below the
+        # precision goal are frozen, and the iteration continues on a compacted
+        # copy of the remaining ones. Typically, most points converge in a few
+        # steps and only a handful of grazing geometries need many more. Masked
+        # positions are frozen from the start.
+        #
+        # The loop uses only elementwise ufuncs plus one reduction per step, the
+        # single point where a GPU array library would need to synchronize.
+        # However, polymath objects hold NumPy arrays, so there is no GPU path
+        # here; device arrays would be converted before reaching this method.
+        use_arrays = not np.any(p.mask)
+        if use_arrays:
+            p_shape = np.broadcast(p.vals, f0.vals).shape
+            p = np.array(np.broadcast_to(p.vals, p_shape), dtype='float')
+            p = p.ravel()
+            coeffs = [np.broadcast_to(c.vals, p_shape).ravel()
+                      for c in f_coeffs + df_coeffs]
+            lanes = None            # indices of active elements; None for all
+            p_active = p
+
+            # Masked elements are excluded from the convergence test
+            pos_mask = np.broadcast_to(f0.mask, p_shape).ravel()
+            has_mask = np.any(pos_mask)
+            still_active = np.logical_not(pos_mask)
+
+            # Positions already on the surface, such as ground tracks, have
+            # p = 0 within the precision goal: f(0) = f0, and |df/dp| at p = 0
+            # is at least 2*R because B, C >= 1. These are frozen as well.
+            f0_vals = np.broadcast_to(f0.vals, p_shape).ravel()
+            on_surface = np.abs(f0_vals) < precision * R
+            if np.any(on_surface):
+                p[on_surface] = 0.
+                still_active &= np.logical_not(on_surface)
+
+        f_leading = self._poly_leading
+        df_leading = self._dpoly_leading
+
         # Iterate until convergence stops
         max_dp = 1.e99
         converged = False
@@ -514,16 +775,239 @@ class Ellipsoid(Surface):
         # We typically need a few extra iterations to reach desired precision
         for count in range(SURFACE_PHOTONS.max_iterations + 10):
 
-            # Calculate f and df/dp
-            f = (((((f6*p + f5)*p + f4)*p + f3)*p + f2)*p + f1)*p + f0
-            df_dp = ((((g5*p + g4)*p + g3)*p + g2)*p + g1)*p + g0
+            prev_max_dp = max_dp
+            if use_arrays:
+
+                # Freeze converged elements once enough of them are done for
+                # compaction to pay off
+                if np.count_nonzero(still_active) < 0.8 * still_active.size:
+                    if lanes is None:
+                        lanes = np.flatnonzero(still_active)
+                    else:
+                        p[lanes] = p_active
+                        lanes = lanes[still_active]
+                    coeffs = [c[still_active] for c in coeffs]
+                    p_active = p_active[still_active]
+
+                # Calculate f and df/dp by Horner's rule, updating in place.
+                # (Estrin's scheme shortens the dependency chain, but under
+                # NumPy every extra term is another pass over the arrays.)
+                f = f_leading[0] * p_active
+                f += f_leading[1]
+                for coeff in coeffs[:len(f_coeffs)]:
+                    f *= p_active
+                    f += coeff
+
+                df_dp = df_leading[0] * p_active
+                df_dp += df_leading[1]
+                for coeff in coeffs[len(f_coeffs):]:
+                    df_dp *= p_active
+                    df_dp += coeff
+
+                # One step of Newton's method
+                with np.errstate(divide='ignore', invalid='ignore'):
+                    f /= df_dp
+                dp = f
+                p_active -= dp
+
+                abs_dp = np.abs(dp)
+                if has_mask and lanes is None:
+                    abs_dp[pos_mask] = 0.
+
+                max_dp = float(np.fmax.reduce(abs_dp, initial=-1.))
+                still_active = abs_dp > precision   # False if not finite
+            else:
+                dp = self._newton_step(p, f_coeffs, df_coeffs)
+                p -= dp
+                max_dp = dp.abs().max(builtins=True, masked=-1.)
+
+            if LOGGING.surface_iterations or Ellipsoid.DEBUG:
+                LOGGING.convergence(
+                            '%s.intercept_normal_to(): iter=%d; change[km]=%.6g'
+                            % (type(self).__name__, count+1, max_dp * km_scale))
+
+            if max_dp <= precision:
+                converged = True
+                break
+
+            if max_dp >= prev_max_dp:
+                break
+
+        if not converged:
+            LOGGING.warn('%s.intercept_normal_to() did not converge: '
+                         'iter=%d; change[km]=%.6g'
+                         % (type(self).__name__, count+1, max_dp * km_scale))
+
+        if use_arrays:
+            if lanes is not None:
+                p[lanes] = p_active
+
+            p = p.reshape(p_shape)
+            p_mask = ~np.isfinite(p) | pos_mask.reshape(p_shape)
+
+        # With derivatives, take one more Newton step in polymath, starting
+        # from the converged p. Because f(p) is ~0 there, this leaves the value
+        # of p unchanged within the precision goal, but its derivatives become
+        # those of the exact root, -(df/dpos) / (df/dp).
+        if use_arrays and f0.derivs:
+            if np.any(p_mask):
+                p[p_mask] = 0.
+                p = Scalar(p, p_mask)
+            else:
+                p = Scalar(p)
+
+            p = p - self._newton_step(p, f_coeffs, df_coeffs)
+
+        elif use_arrays:
+
+            # Divide all three components at once by (1+p, 1+B*p, 1+C*p),
+            # writing the quotients over the denominators. (A true division is
+            # both faster than reciprocal-and-multiply under NumPy and exact.)
+            denoms = 1. + np.array([1., B, C]) * p[..., np.newaxis]
+
+            cept_mask = p_mask
+            zeros = (denoms == 0.)
+            if np.any(zeros):
+                cept_mask = cept_mask | np.any(zeros, axis=-1)
+
+            with np.errstate(divide='ignore', invalid='ignore'):
+                cept_vals = np.divide(pos.vals, denoms, out=denoms)
+
+            p = Scalar(p, p_mask if np.any(p_mask) else False)
+            cept = Vector3(cept_vals, cept_mask if np.any(cept_mask) else False)
+
+        if not use_arrays or f0.derivs:
+            cept_x = pos_x / (1 + p)
+            cept_y = pos_y / (1 + B * p)
+            cept_z = pos_z / (1 + C * p)
+            cept = Vector3.from_scalars(cept_x, cept_y, cept_z)
+
+        if guess is None:
+            return cept
+        else:
+            return (cept, p)
+
+    #===========================================================================
+    def _newton_step(self, p, f_coeffs, df_coeffs):
+        """One Newton step, f(p) / (df/dp), for the polynomial solved by
+        intercept_normal_to(), using polymath Scalars.
+        """
+
+        f_leading = self._poly_leading
+        df_leading = self._dpoly_leading
+
+        f = f_leading[0] * p + f_leading[1]
+        for coeff in f_coeffs:
+            f = f * p + coeff
+
+        df_dp = df_leading[0] * p + df_leading[1]
+        for coeff in df_coeffs:
+            df_dp = df_dp * p + coeff
+
+        return f / df_dp
+
+    #===========================================================================
+    def _intercept_normal_to_sphere(self, pos, guess):
+        """Internal version of intercept_normal_to() for a sphere.
+
+        Because the normal is parallel to the position, the intercept is pos
+        rescaled to the radius, and p = |pos|/req - 1. The input pos must
+        already have the exclusion zone applied.
+        """
+
+        norm = pos.norm()
+        cept = pos * (self.req / norm)
+
+        if guess is None:
+            return cept
+        else:
+            return (cept, norm / self.req - 1.)
+
+    #===========================================================================
+    def _poly_coefficients(self, X, Y, Z):
+        """The non-leading coefficients of the polynomial solved by
+        intercept_normal_to() and of its derivative, in order of decreasing
+        power. X, Y and Z can be Scalars, arrays or floats.
+        """
+
+        f_coeffs = [X * xc + Y * yc + Z * zc - rc
+                    for (xc, yc, zc, rc) in self._poly_xyzr]
+        f_coeffs.append(X + Y + Z - self.req_sq)
+
+        # The coefficient of p**(k-1) in df/dp is k times that of p**k in f
+        k = len(self._poly_xyzr)
+        df_coeffs = [(k - i) * f if k - i > 1 else f
+                     for (i, f) in enumerate(f_coeffs[:-1])]
+
+        return (f_coeffs, df_coeffs)
+
+    #===========================================================================
+    def _intercept_normal_to_float(self, pos, guess):
+        """Internal version of intercept_normal_to() for a single position
+        without derivatives.
+
+        The Newton iteration is identical, but it uses Python floats, avoiding
+        the cost of constructing polymath objects at every step. It returns
+        None for a position in the exclusion zone, a masked or shaped guess, or
+        a degenerate step, in which case the general solution should be used.
+        """
+
+        if isinstance(guess, (type(None), bool, np.bool_)):
+            p = None
+        else:
+            guess = Scalar.as_scalar(guess, recursive=False)
+            if guess.shape or guess.mask:
+                return None
+            p = float(guess.vals)
+
+        (pos_x, pos_y, pos_z) = pos.vals.tolist()
+        (ux, uy, uz) = self.unsquash.vals.tolist()
+        (pos_ux, pos_uy, pos_uz) = (pos_x * ux, pos_y * uy, pos_z * uz)
+        unsq_norm = math.sqrt(pos_ux**2 + pos_uy**2 + pos_uz**2)
+        if unsq_norm < self.r_exclusion:
+            return None
+
+        B = self.unsquash_y_sq
+        C = self.unsquash_z_sq
+
+        X = pos_x**2
+        Y = pos_y**2 * B
+        Z = pos_z**2 * C
+
+        (f_coeffs, df_coeffs) = self._poly_coefficients(X, Y, Z)
+        f_leading = self._poly_leading
+        df_leading = self._dpoly_leading
+
+        # Initial guess at p, as in intercept_normal_to()
+        if p is None:
+            normal_norm = (self.req / unsq_norm
+                           * math.sqrt((pos_ux * ux**2)**2 + (pos_uy * uy**2)**2
+                                       + (pos_uz * uz**2)**2))
+            p = (unsq_norm - self.req) / normal_norm
+
+        km_scale = self.req
+        precision = SURFACE_PHOTONS.km_precision / km_scale
+
+        max_dp = 1.e99
+        converged = False
+        for count in range(SURFACE_PHOTONS.max_iterations + 10):
+
+            f = f_leading[0] * p + f_leading[1]
+            for coeff in f_coeffs:
+                f = f * p + coeff
+
+            df_dp = df_leading[0] * p + df_leading[1]
+            for coeff in df_coeffs:
+                df_dp = df_dp * p + coeff
+
+            if df_dp == 0.:
+                return None
 
-            # One step of Newton's method
             dp = f / df_dp
             p -= dp
 
             prev_max_dp = max_dp
-            max_dp = dp.abs().max(builtins=True, masked=-1.)
+            max_dp = abs(dp)
 
             if LOGGING.surface_iterations or Ellipsoid.DEBUG:
                 LOGGING.convergence(
@@ -542,15 +1026,18 @@ class Ellipsoid(Surface):
                          'iter=%d; change[km]=%.6g'
                          % (type(self).__name__, count+1, max_dp * km_scale))
 
-        cept_x = pos_x / (1 + p)
-        cept_y = pos_y / (1 + B * p)
-        cept_z = pos_z / (1 + C * p)
-        cept = Vector3.from_scalars(cept_x, cept_y, cept_z)
+        denoms = (1. + p, 1. + B * p, 1. + C * p)
+        if 0. in denoms:
+            return None
+
+        # Vector3 is constructed faster from an ndarray than from a tuple
+        cept = Vector3(np.array((pos_x / denoms[0], pos_y / denoms[1],
+                                 pos_z / denoms[2])))
 
         if guess is None:
             return cept
         else:
-            return (cept, p)
+            return (cept, Scalar(p))
 
     #===========================================================================
     def _apply_exclusion(self, pos):
@@ -564,14 +1051,20 @@ class Ellipsoid(Surface):
             libraries.
         """
 
-        pos_unsquashed = pos.element_mul(self.unsquash)
-        norm_sq = pos_unsquashed.wod.norm_sq()
-        mask = (norm_sq < self.r_exclusion**2)
-        if not mask.any():
+        # Locate the excluded points using the ndarray alone; in the usual
+        # case where there are none, no polymath objects are constructed.
+        pos_vals = pos.vals
+        norm_sq = (pos_vals * pos_vals) @ self.unsquash_sq.vals
+        mask = (norm_sq < self.r_exclusion**2) & np.logical_not(pos.mask)
+        if not np.any(mask):
             return pos
 
-        rescale = Scalar.maximum(1., self.r_exclusion / norm_sq.sqrt())
-        return (pos * rescale).remask_or(mask)
+        # Points at the origin have no direction and are left in place
+        with np.errstate(divide='ignore'):
+            rescale = np.where(mask & (norm_sq > 0.),
+                               self.r_exclusion / np.sqrt(norm_sq), 1.)
+
+        return (pos * Scalar(rescale)).remask_or(mask)
 
     ############################################################################
     # Longitude conversions
@@ -587,8 +1080,7 @@ class Ellipsoid(Surface):
         Return          planetocentric longitude.
         """
 
-        lon = Scalar.as_scalar(lon, recursive=derivs)
-        return (lon.sin() * self.squash_y).arctan2(lon.cos())
+        return self._scale_lon(lon, self.squash_y, derivs)
 
     #===========================================================================
     def lon_from_centric(self, lon, derivs=False):
@@ -601,8 +1093,7 @@ class Ellipsoid(Surface):
         Return          squashed longitude.
         """
 
-        lon = Scalar.as_scalar(lon, recursive=derivs)
-        return (lon.sin() * self.unsquash_y).arctan2(lon.cos())
+        return self._scale_lon(lon, self.unsquash_y, derivs)
 
     #===========================================================================
     def lon_to_graphic(self, lon, derivs=False):
@@ -615,8 +1106,7 @@ class Ellipsoid(Surface):
         Return          planetographic longitude.
         """
 
-        lon = Scalar.as_scalar(lon, recursive=derivs)
-        return (lon.sin() * self.unsquash_y).arctan2(lon.cos())
+        return self._scale_lon(lon, self.unsquash_y, derivs)
 
     #===========================================================================
     def lon_from_graphic(self, lon, derivs=False):
@@ -629,8 +1119,22 @@ class Ellipsoid(Surface):
         Return          squashed longitude.
         """
 
+        return self._scale_lon(lon, self.squash_y, derivs)
+
+    #===========================================================================
+    def _scale_lon(self, lon, factor, derivs):
+        """Longitude after scaling its sine by the given factor, as used by the
+        four longitude conversions.
+
+        Without derivatives, this operates directly on the ndarray.
+        """
+
         lon = Scalar.as_scalar(lon, recursive=derivs)
-        return (lon.sin() * self.squash_y).arctan2(lon.cos())
+        if lon.derivs:
+            return (lon.sin() * factor).arctan2(lon.cos())
+
+        return Scalar(np.arctan2(np.sin(lon.vals) * factor, np.cos(lon.vals)),
+                      lon.mask)
 
     ############################################################################
     # Latitude conversions
@@ -647,12 +1151,8 @@ class Ellipsoid(Surface):
         Return          planetocentric latitude.
         """
 
-        lon = Scalar.as_scalar(lon, recursive=derivs)
-        lat = Scalar.as_scalar(lat, recursive=derivs)
-
-        denom = (lon.cos()**2 + (lon.sin() * self.squash_y)**2).sqrt()
-
-        return (lat.tan() * self.squash_z / denom).arctan()
+        return self._scale_lat(lat, lon, derivs, self.squash_y, self.squash_z,
+                               divide=True)
 
     #===========================================================================
     def lat_from_centric(self, lat, lon, derivs=False):
@@ -666,12 +1166,8 @@ class Ellipsoid(Surface):
         Return          squashed latitude.
         """
 
-        lon = Scalar.as_scalar(lon, recursive=derivs)
-        lat = Scalar.as_scalar(lat, recursive=derivs)
-
-        factor = (lon.cos()**2 + (lon.sin() * self.squash_y)**2).sqrt()
-
-        return (lat.tan() * self.unsquash_z * factor).arctan()
+        return self._scale_lat(lat, lon, derivs, self.squash_y, self.unsquash_z,
+                               divide=False)
 
     #===========================================================================
     def lat_to_graphic(self, lat, lon, derivs=False):
@@ -685,12 +1181,8 @@ class Ellipsoid(Surface):
         Return          planetographic latitude.
         """
 
-        lon = Scalar.as_scalar(lon, recursive=derivs)
-        lat = Scalar.as_scalar(lat, recursive=derivs)
-
-        denom = (lon.cos()**2 + (lon.sin() * self.unsquash_y)**2).sqrt()
-
-        return (lat.tan() * self.unsquash_z / denom).arctan()
+        return self._scale_lat(lat, lon, derivs, self.unsquash_y,
+                               self.unsquash_z, divide=True)
 
     #===========================================================================
     def lat_from_graphic(self, lat, lon, derivs=False):
@@ -704,11 +1196,45 @@ class Ellipsoid(Surface):
         Return          squashed latitude.
         """
 
+        return self._scale_lat(lat, lon, derivs, self.unsquash_y, self.squash_z,
+                               divide=False)
+
+    #===========================================================================
+    def _scale_lat(self, lat, lon, derivs, factor_y, factor_z, divide):
+        """Latitude after scaling its tangent, as used by the four latitude
+        conversions.
+
+        The tangent is multiplied by factor_z and then divided by, or
+        multiplied by, sqrt(cos(lon)**2 + (sin(lon) * factor_y)**2). Without
+        derivatives, this operates directly on the ndarrays.
+        """
+
         lon = Scalar.as_scalar(lon, recursive=derivs)
         lat = Scalar.as_scalar(lat, recursive=derivs)
 
-        factor = (lon.cos()**2 + (lon.sin() * self.unsquash_y)**2).sqrt()
+        # Because cos(lon)**2 + (sin(lon) * factor_y)**2 equals
+        # 1 + (factor_y**2 - 1) * sin(lon)**2, only the sine is needed. When
+        # factor_y == 1, as for an oblate body, the scale is unity, although
+        # the result still takes the shape and mask of lon.
+        if lat.derivs or lon.derivs:
+            scale = (1. + (factor_y**2 - 1.) * lon.sin()**2).sqrt()
+            if divide:
+                return (lat.tan() * factor_z / scale).arctan()
+            return (lat.tan() * factor_z * scale).arctan()
+
+        tan_lat = np.tan(lat.vals)
+        tan_lat *= factor_z
+        if factor_y == 1.:
+            shape = np.broadcast_shapes(np.shape(lat.vals), np.shape(lon.vals))
+            if np.shape(tan_lat) != shape:
+                tan_lat = np.broadcast_to(tan_lat, shape)
+        else:
+            scale = np.sqrt(1. + (factor_y**2 - 1.) * np.sin(lon.vals)**2)
+            if divide:
+                tan_lat = tan_lat / scale
+            else:
+                tan_lat = tan_lat * scale
 
-        return (lat.tan() * self.squash_z * factor).arctan()
+        return Scalar(np.arctan(tan_lat), np.logical_or(lat.mask, lon.mask))
 
 ################################################################################
@@ -61,8 +61,7 @@ class GraphicEllipsoid(Ellipsoid):
             (track, p) = self.intercept_normal_to(pos, guess=True)
         else:
             p = Scalar.as_scalar(hints, recursive=derivs)
-            denom = Vector3.ONES + p * self.unsquash_sq
-            track = pos.element_div(denom)
+            track = self._track_from_hints(pos, p)
 
         # Derive the coordinates
         normal = track.element_mul(self.unsquash_sq)
@@ -87,6 +87,9 @@ class Spheroid(Ellipsoid):
         pos = Vector3.as_vector3(pos, recursive=derivs)
         pos = self._apply_exclusion(pos)
 
+        if self._is_sphere:
+            return self._intercept_normal_to_sphere(pos, guess)
+
         # If we work in the plane defined by the position and the Z-axis, this
         # becomes a 2-D problem, with pos = (pos_x, pos_z).
 
@@ -0,0 +1,3 @@
+################################################################################
+# tests/backplane/__init__.py
+################################################################################
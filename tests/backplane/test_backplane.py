@@ -0,0 +1,53 @@
+################################################################################
+# tests/backplane/test_backplane.py
+################################################################################
+
+import numpy as np
+import unittest
+
+from oops.backplane   import Backplane
+from oops.fov         import FlatFOV
+from oops.observation import Snapshot
+
+
+class Test_Backplane(unittest.TestCase):
+
+    def runTest(self):
+
+        fov = FlatFOV((1.e-3, 1.e-3), (4,3))
+        obs = Snapshot(('u','v'), 0., 1., fov, 'SSB', 'J2000')
+        bp = Backplane(obs)
+
+        ####################################
+        # register_backplane with raw NumPy arrays
+
+        # A 0-D array keeps its shape
+        result = bp.register_backplane(('zero_d',), np.array(2.))
+        self.assertEqual(result.shape, ())
+        self.assertEqual(result, 2.)
+
+        # A strided array is stored in C order
+        vals = np.arange(24.).reshape(4,6)[:,::2]
+        result = bp.register_backplane(('strided',), vals)
+        self.assertTrue(result.vals.flags.c_contiguous)
+        self.assertTrue(np.all(result.vals == vals))
+
+        ####################################
+        # Center RA and dec with an empty event key re-use the pixel values
+
+        for apparent in (True, False):
+            ra  = bp.right_ascension((), apparent=apparent)
+            dec = bp.declination((), apparent=apparent)
+            center_ra  = bp.center_right_ascension((), apparent=apparent)
+            center_dec = bp.center_declination((), apparent=apparent)
+
+            self.assertTrue(np.all(center_ra.vals == ra.vals))
+            self.assertTrue(np.all(center_dec.vals == dec.vals))
+            self.assertEqual(center_ra.key[0], 'center_right_ascension')
+            self.assertEqual(bp.right_ascension((), apparent=apparent).key,
+                             ('right_ascension', (), apparent, 'arr'))
+
+########################################
+if __name__ == '__main__':
+    unittest.main(verbosity=2)
+################################################################################
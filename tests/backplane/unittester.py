@@ -0,0 +1,12 @@
+################################################################################
+# tests/backplane/unittester.py
+################################################################################
+
+import unittest
+
+from tests.backplane.test_backplane import Test_Backplane
+
+########################################
+if __name__ == '__main__':
+    unittest.main(verbosity=2)
+################################################################################
@@ -0,0 +1,45 @@
+################################################################################
+# tests/path/test_fixedpath.py
+################################################################################
+
+import numpy as np
+import unittest
+
+from polymath  import Vector3
+from oops      import Frame
+from oops.path import Path, FixedPath
+
+
+class Test_FixedPath(unittest.TestCase):
+
+    def runTest(self):
+
+        np.random.seed(6513)
+
+        ####################################
+        # A catalog of fixed points evaluated at an array of times
+
+        positions = np.random.randn(7,3) * 1.e6
+        catalog = FixedPath(positions, Path.SSB, Frame.J2000)
+        self.assertEqual(catalog.shape, (7,))
+
+        times = np.arange(5.)[:,np.newaxis] * 86400.
+        event = catalog.event_at_time(times)
+        self.assertEqual(event.shape, (5,7))
+
+        self.assertEqual(event.pos, Vector3(positions))
+        self.assertEqual(event.vel, Vector3.ZERO)
+
+        ####################################
+        # __getstate__/__setstate__
+
+        state = catalog.__getstate__()
+
+        copied = Path.__new__(FixedPath)
+        copied.__setstate__(state)
+        self.assertEqual(copied.pos, catalog.pos)
+
+########################################
+if __name__ == '__main__':
+    unittest.main(verbosity=2)
+################################################################################
@@ -0,0 +1,63 @@
+################################################################################
+# tests/path/test_linearpath.py
+################################################################################
+
+import numpy as np
+import unittest
+
+from polymath  import Scalar
+from oops.path import Path, LinearPath
+
+
+class Test_LinearPath(unittest.TestCase):
+
+    def setUp(self):
+        Path.reset_registry()
+
+    def tearDown(self):
+        Path.reset_registry()
+
+    def runTest(self):
+
+        ####################################
+        # A path with zero velocity still takes the shape and mask of the time
+
+        static = LinearPath(([1,2,3],[0,0,0]), 0., 'SSB')
+
+        event = static.event_at_time(np.arange(7.))
+        self.assertEqual(event.pos.shape, (7,))
+        self.assertEqual(event.pos, (1,2,3))
+        self.assertEqual(event.vel, (0,0,0))
+
+        mask = np.arange(7) % 2 == 0
+        event = static.event_at_time(Scalar(np.arange(7.), mask))
+        self.assertEqual(event.pos.shape, (7,))
+        self.assertTrue(np.all(event.pos.mask == mask))
+
+        event = static.event_at_time(1.)
+        self.assertEqual(event.pos.shape, ())
+        self.assertEqual(event.pos, (1,2,3))
+
+        ####################################
+        # pos_vel_arrays() matches event_at_time() without building an Event
+
+        slider = LinearPath(([1,2,3],[4,5,6]), 2., 'SSB')
+        times = np.arange(10.)
+
+        (pos, vel) = slider.pos_vel_arrays(times)
+        self.assertEqual(pos.shape, (10,3))
+        self.assertEqual(vel.shape, (10,3))
+        self.assertFalse(vel.flags.writeable)
+
+        event = slider.event_at_time(times)
+        self.assertTrue(np.all(pos == event.pos.vals))
+        self.assertTrue(np.all(vel == event.vel.vals))
+
+        (pos, vel) = slider.pos_vel_arrays(3.)
+        self.assertTrue(np.all(pos == [5,7,9]))
+        self.assertTrue(np.all(vel == [4,5,6]))
+
+########################################
+if __name__ == '__main__':
+    unittest.main(verbosity=2)
+################################################################################
@@ -7,9 +7,10 @@ import unittest
 
 import cspyce
 
+from polymath    import Scalar, Vector3
 from oops.config import QUICK
 from oops.body   import Body
-from oops.frame  import Frame, SpiceFrame
+from oops.frame  import Frame, Navigation, SpiceFrame
 from oops.path   import (Path, LinkedPath, ReversedPath, RelativePath,
                          RotatedPath, QuickPath, LinearPath, SpicePath)
 from oops.unittester_support import TEST_SPICE_PREFIX
@@ -46,8 +47,10 @@ class Test_Path(unittest.TestCase):
         linked_event = linked.event_at_time(times)
 
         eps = 1.e-6
-        self.assertTrue(((linked_event.pos - direct_event.pos).norm() <= eps).all())
-        self.assertTrue(((linked_event.vel - direct_event.vel).norm() <= eps).all())
+        np.testing.assert_allclose(linked_event.pos.values,
+                                   direct_event.pos.values, rtol=0., atol=eps)
+        np.testing.assert_allclose(linked_event.vel.values,
+                                   direct_event.vel.values, rtol=0., atol=eps)
 
         # RelativePath
         relative = RelativePath(linked, SpicePath('MARS', 'SUN'))
@@ -57,8 +60,10 @@ class Test_Path(unittest.TestCase):
         relative_event = relative.event_at_time(times)
 
         eps = 1.e-6
-        self.assertTrue(((relative_event.pos - direct_event.pos).norm() <= eps).all())
-        self.assertTrue(((relative_event.vel - direct_event.vel).norm() <= eps).all())
+        np.testing.assert_allclose(relative_event.pos.values,
+                                   direct_event.pos.values, rtol=0., atol=eps)
+        np.testing.assert_allclose(relative_event.vel.values,
+                                   direct_event.vel.values, rtol=0., atol=eps)
 
         # ReversedPath
         reversed = ReversedPath(relative)
@@ -68,8 +73,10 @@ class Test_Path(unittest.TestCase):
         reversed_event = reversed.event_at_time(times)
 
         eps = 1.e-6
-        self.assertTrue(((reversed_event.pos - direct_event.pos).norm() <= eps).all())
-        self.assertTrue(((reversed_event.vel - direct_event.vel).norm() <= eps).all())
+        np.testing.assert_allclose(reversed_event.pos.values,
+                                   direct_event.pos.values, rtol=0., atol=eps)
+        np.testing.assert_allclose(reversed_event.vel.values,
+                                   direct_event.vel.values, rtol=0., atol=eps)
 
         # RotatedPath
         rotated = RotatedPath(reversed, SpiceFrame('B1950'))
@@ -79,8 +86,10 @@ class Test_Path(unittest.TestCase):
         rotated_event = rotated.event_at_time(times)
 
         eps = 1.e-6
-        self.assertTrue(((rotated_event.pos - direct_event.pos).norm() <= eps).all())
-        self.assertTrue(((rotated_event.vel - direct_event.vel).norm() <= eps).all())
+        np.testing.assert_allclose(rotated_event.pos.values,
+                                   direct_event.pos.values, rtol=0., atol=eps)
+        np.testing.assert_allclose(rotated_event.vel.values,
+                                   direct_event.vel.values, rtol=0., atol=eps)
 
         # QuickPath tests
         moon = SpicePath('MOON', 'EARTH')
@@ -129,6 +138,14 @@ class Test_Path(unittest.TestCase):
         self.assertEqual(event.pos, (-1,-3,2))
         self.assertEqual(event.vel, ( 0,-3,2))
 
+        # Velocity defined via a time-derivative
+        pos = Vector3((1,2,3), derivs={'t': Vector3((0,0,4))})
+        slider4 = LinearPath(pos, 2., ssb)
+
+        event = slider4.event_at_time(3.)
+        self.assertEqual(event.pos, (1,2,7))
+        self.assertEqual(event.vel, (0,0,4))
+
         # Link unregistered frame to registered frame
         static = slider3.wrt(ssb)
 
@@ -143,6 +160,34 @@ class Test_Path(unittest.TestCase):
         self.assertEqual(event.pos, (0,0,0))
         self.assertEqual(event.vel, (0,0,0))
 
+
+class Test_RotatedPath_Fittable(unittest.TestCase):
+
+    def setUp(self):
+        Path.reset_registry()
+        Frame.reset_registry()
+
+    def tearDown(self):
+        Path.reset_registry()
+        Frame.reset_registry()
+
+    def runTest(self):
+
+        # A RotatedPath must follow changes to a fittable frame, even when it
+        # is called again with the same read-only time
+        fixed = LinearPath(([1,0,0],[0,0,0]), 0., 'SSB')
+        nav = Navigation((0.,0.,0.), 'J2000')
+        rotated = RotatedPath(fixed, nav)
+        time = Scalar(1.).as_readonly()
+
+        event = rotated.event_at_time(time)
+        self.assertEqual(event.pos, (1,0,0))
+
+        nav.set_params((0.,0.,0.5))
+        event = rotated.event_at_time(time)
+        self.assertTrue(abs(event.pos - (np.cos(0.5), -np.sin(0.5), 0.))
+                        < 1.e-15)
+
 ########################################
 if __name__ == '__main__':
     unittest.main(verbosity=2)
@@ -4,9 +4,11 @@
 
 import unittest
 
-from tests.path.test_path       import Test_Path
+from tests.path.test_path       import Test_Path, Test_RotatedPath_Fittable
 from tests.path.test_circlepath import Test_CirclePath
+from tests.path.test_fixedpath  import Test_FixedPath
 from tests.path.test_keplerpath import Test_KeplerPath
+from tests.path.test_linearpath import Test_LinearPath
 from tests.path.test_multipath  import Test_MultiPath
 from tests.path.test_spicepath  import Test_SpicePath
 
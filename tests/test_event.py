@@ -9,6 +9,8 @@ from polymath       import Vector3
 from oops.body      import Body
 from oops.event     import Event
 from oops.constants import C, RPD
+from oops.frame     import Frame, Navigation
+from oops.path      import Path, LinearPath, RotatedPath
 
 
 class Test_Event(unittest.TestCase):
@@ -726,7 +728,37 @@ class Test_Event(unittest.TestCase):
                 self.assertIsNotNone(ev._ssb_.dep)
                 self.assertIsNotNone(ev._ssb_.dep_ap)
 
-#########################################
+#
+
+class Test_Event_DefaultFrame(unittest.TestCase):
+
+    def setUp(self):
+        Path.reset_registry()
+        Frame.reset_registry()
+
+    def tearDown(self):
+        Path.reset_registry()
+        Frame.reset_registry()
+
+    def runTest(self):
+
+        tilted = Navigation((0.,0.,0.1), 'J2000', frame_id='TILTED')
+        path = LinearPath(([1,0,0],[0,0,0]), 0., 'SSB', 'TILTED',
+                          path_id='TEST_PATH')
+
+        # With an origin ID, the frame comes from the registered path
+        event = Event(0., Vector3.ZERO, 'TEST_PATH')
+        self.assertIs(event.frame, tilted.wayframe)
+
+        # A rotated path shares the waypoint but has its own frame
+        turned = Navigation((0.,0.,0.2), 'J2000', frame_id='TURNED')
+        rotated = RotatedPath(path, turned)
+        self.assertIs(rotated.waypoint, path.waypoint)
+
+        event = Event(0., Vector3.ZERO, rotated)
+        self.assertIs(event.frame, turned.wayframe)
+
+########################################
 if __name__ == '__main__':
     unittest.main(verbosity=2)
 ################################################################################
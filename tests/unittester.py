@@ -4,6 +4,7 @@
 
 import unittest
 
+from tests.backplane.unittester   import *
 from tests.cadence.unittester     import *
 from tests.calibration.unittester import *
 from tests.fov.unittester         import *